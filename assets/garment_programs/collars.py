@@ -1,9 +1,15 @@
-import numpy as np
+import math
+
 import pygarment as pyg
 from assets.garment_programs.bands import StraightBandPanel
 from assets.garment_programs.circle_skirt import CircleArcPanel
 from scipy.spatial.transform import Rotation as R
 
+# NOTE: Constant panel rotations are evaluated once on import
+# (Rotation objects are immutable, so sharing them between panels is safe)
+_LAPEL_BACK_ROT = R.from_euler('XYZ', [90, 45, 0], degrees=True)
+_HOOD_SIDE_ROT = R.from_euler('XYZ', [0, -90, 0], degrees=True)
+
 # # ------ Collar shapes withough extra panels ------
 
 
@@ -26,14 +32,13 @@ def TrapezoidNeckHalf(depth, width, angle=90, verbose=True, **kwargs):
     """Trapesoid neck design"""
 
     # Special case when angle = 180 (sin = 0)
-    if (pyg.utils.close_enough(angle, 180, tol=1)
-            or pyg.utils.close_enough(angle, 0, tol=1)):
+    if 179 < angle < 181 or -1 < angle < 1:
         # degrades into VNeck
         return VNeckHalf(depth, width)
 
-    rad_angle = np.deg2rad(angle)
+    rad_angle = math.radians(angle)
 
-    bottom_x = -depth * np.cos(rad_angle) / np.sin(rad_angle)
+    bottom_x = -depth * math.cos(rad_angle) / math.sin(rad_angle)
     if bottom_x > width / 2:  # Invalid angle/depth/width combination resulted in invalid shape
         if verbose:
             print('TrapezoidNeckHalf::WARNING::Parameters are invalid and create overlap: '
@@ -62,7 +67,7 @@ def CircleArcNeckHalf(depth, width, angle=90, flip=False, **kwargs):
     """Collar with a side represented by a circle arc"""
     # 1/4 of a circle
     edges = pyg.EdgeSequence(pyg.CircleEdgeFactory.from_points_angle(
-        [0, 0], [width / 2, -depth], arc_angle=np.deg2rad(angle),
+        [0, 0], [width / 2, -depth], arc_angle=math.radians(angle),
         right=(not flip)
     ))
 
@@ -188,16 +193,13 @@ class SimpleLapelPanel(pyg.Panel):
     def __init__(self, name, length, max_depth) -> None:
         super().__init__(name)
 
-        self.edges = pyg.EdgeSeqFactory.from_verts(
-            [0, 0], [max_depth, 0], [max_depth, -length]
-        )
-
-        self.edges.append(
-            pyg.CurveEdge(
-                self.edges[-1].end,
-                self.edges[0].start,
-                [[0.7, 0.2]]
-            )
+        # NOTE: Curve control points are relative to the edge,
+        # so the shape only needs its three corner vertices
+        top_left, top_right, bottom = [0, 0], [max_depth, 0], [max_depth, -length]
+        self.edges = pyg.EdgeSequence(
+            pyg.Edge(top_left, top_right),
+            pyg.Edge(top_right, bottom),
+            pyg.CurveEdge(bottom, top_left, [[0.7, 0.2]])
         )
 
         self.interfaces = {
@@ -250,7 +252,7 @@ class SimpleLapel(pyg.Component):
             self.back = CircleArcPanel(
                 f'{tag}_collar_back', rad, depth, angle
             ).translate_by([-length_b, height_p, -10])
-            self.back.rotate_by(R.from_euler('XYZ', [90, 45, 0], degrees=True))
+            self.back.rotate_by(_LAPEL_BACK_ROT)
 
         if standing:
             self.back.interfaces['right'].set_right_wrong(True)
@@ -334,7 +336,7 @@ class HoodPanel(pyg.Panel):
             'to_bodice': pyg.Interface(self, self.edges[0:2]).reverse()
         }
 
-        self.rotate_by(R.from_euler('XYZ', [0, -90, 0], degrees=True))
+        self.rotate_by(_HOOD_SIDE_ROT)
         self.translate_by([-width, 0, 0])
 
 
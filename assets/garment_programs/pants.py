@@ -1,4 +1,5 @@
 from copy import deepcopy
+import math
 import numpy as np
 
 import pygarment as pyg
@@ -26,7 +27,7 @@ class PantPanel(pyg.Panel):
         flare = body['leg_circ'] * (design['flare']['v']  - 1) / 4 
         hips_depth = hips_depth * hipline_ext
 
-        hip_side_incl = np.deg2rad(body['_hip_inclination'])
+        hip_side_incl = math.radians(body['_hip_inclination'])
         dart_depth = hips_depth * 0.8 
 
         # Crotch cotrols
@@ -39,7 +40,7 @@ class PantPanel(pyg.Panel):
         # amount of extra fabric at waist
         w_diff = hips - waist   # Assume its positive since waist is smaller then hips
         # We distribute w_diff among the side angle and a dart 
-        hw_shift = np.tan(hip_side_incl) * hips_depth
+        hw_shift = math.tan(hip_side_incl) * hips_depth
         # Small difference
         if hw_shift > w_diff:
             hw_shift = w_diff
@@ -2,16 +2,22 @@
     Fitting one sewing pattern design to a set of various body shapes
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
+import multiprocessing
+import os
 import yaml
 import shutil 
+import signal
+import sys
 import time
 import traceback
 import argparse
 
 # Custom
-from pygarment.data_config import Properties
+from pygarment.data_config import Properties, YAMLLoader, YAMLDumper
 from assets.garment_programs.meta_garment import MetaGarment
 from assets.bodies.body_params import BodyParameters
 
@@ -24,6 +30,7 @@ def get_command_args():
     parser.add_argument('--size', '-s', help='size of a sample', type=int, default=10)
     parser.add_argument('--name', '-n', help='Name of the dataset', type=str, default='design_fit')
     parser.add_argument('--replicate', '-re', help='Name of the dataset to re-generate. If set, other arguments are ignored', type=str, default=None)
+    parser.add_argument('--workers', '-w', help='number of parallel worker processes (default: number of CPUs)', type=int, default=None)
     
 
     args = parser.parse_args()
@@ -102,24 +109,61 @@ def _save_sample(piece, body, new_design, folder, verbose=False):
         with_3d=False, with_text=False, view_ids=False)
 
     body.save(folder)
-    with open(Path(folder) / 'design_params.yaml', 'w') as f:
+    # NOTE: Emit to a string first s.t. the file is written in one go
+    (Path(folder) / 'design_params.yaml').write_text(
         yaml.dump(
-            {'design': new_design}, 
-            f,
+            {'design': new_design},
+            Dumper=YAMLDumper,
             default_flow_style=False,
             sort_keys=False
         )
+    )
     if verbose:
         print(f'Saved {piece.name}')
 
 
 
-def generate(path, properties, sys_paths, verbose=False):
+def _init_worker():
+    """Leave interrupts to the main process s.t. the workers complete
+        the samples in progress"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _fit_sample(idx, design, body_options, body_samples_path, body_sample_data, verbose=False):
+    """Fit the design to one body sample and save the result
+        (runs in a worker process)
+
+        Returns the sample name and the error traceback (None on success)
+    """
+    name = f'body_{idx}'
+    try:
+        rand_body = body_sample(
+            idx,
+            body_options,
+            body_samples_path,
+            straight='Pants' != design['meta']['bottom']['v'])
+        name = rand_body.params['body_sample']
+
+        piece_shaped = MetaGarment(name, rand_body, design) 
+        
+        # Save samples
+        _save_sample(piece_shaped, rand_body, design, body_sample_data, verbose=verbose)
+    except KeyboardInterrupt:
+        raise
+    except BaseException:
+        return name, traceback.format_exc()
+
+    return name, None
+
+
+def generate(path, properties, sys_paths, verbose=False, workers=None):
     """Generates a synthetic dataset of patterns with given properties
         Params:
             path : path to folder to put a new dataset into
             props : an instance of DatasetProperties class
                     requested properties of the dataset
+            workers : number of worker processes fitting the body samples in
+                parallel (default: number of CPUs)
     """
     path = Path(path)
     gen_config = properties['generator']['config']
@@ -137,39 +181,49 @@ def generate(path, properties, sys_paths, verbose=False):
 
     # Load design 
     with open(properties['design_file'], 'r') as f:
-        design = yaml.safe_load(f)['design']
+        design = yaml.load(f, Loader=YAMLLoader)['design']
 
     # On default body
     default_body = BodyParameters(Path(sys_paths['bodies_default_path']) / (properties['body_default'] + '.yaml'))
     piece_default = MetaGarment(properties['body_default'], default_body, design) 
     _save_sample(piece_default, default_body, design, default_sample_data, verbose=verbose)
-                
-    
-    for i in range(properties['size']):
-        # log properties every time
-        properties.serialize(data_folder / 'dataset_properties.yaml')
 
+    # NOTE: samples are independent from each other => fit them in parallel
+    fit_sample = partial(
+        _fit_sample, 
+        design=design, 
+        body_options=body_options, 
+        body_samples_path=body_samples_path, 
+        body_sample_data=body_sample_data,
+        verbose=verbose)
+    start_id = properties['body_sample_start_id']
+    ids = range(start_id, start_id + properties['size'])
+    workers = workers or os.cpu_count()
+
+    # NOTE: Forked workers inherit the already imported garment programs,
+    # while spawned ones would re-import them on start-up
+    # Fork only on Linux: on macOS forking after numpy/scipy are loaded is unsafe
+    mp_context = (multiprocessing.get_context('fork') 
+                  if sys.platform.startswith('linux') else None)
+    with ProcessPoolExecutor(
+            max_workers=workers, mp_context=mp_context,
+            initializer=_init_worker) as executor:
         try:
-            # On random body shape
-            rand_body = body_sample(
-                i + properties['body_sample_start_id'],
-                body_options,
-                body_samples_path,
-                straight='Pants' != design['meta']['bottom']['v'])
-            name = rand_body.params['body_sample']
-
-            piece_shaped = MetaGarment(name, rand_body, design) 
-            
-            # Save samples
-            _save_sample(piece_shaped, rand_body, design, body_sample_data, verbose=verbose)
-        except KeyboardInterrupt:  # Return immediately with whatever is ready
+            results = executor.map(
+                fit_sample, ids, chunksize=max(1, len(ids) // (workers * 4)))
+            for i, (name, error) in enumerate(results):
+                if error is not None:
+                    print(f'{name} failed')
+                    print(error)
+
+                # log properties periodically
+                if not i % workers:
+                    properties.serialize(data_folder / 'dataset_properties.yaml')
+        except KeyboardInterrupt:  # Return with whatever is ready
+            # NOTE: Samples in progress are completed s.t. none of the sample
+            # folders is left partially written
+            executor.shutdown(wait=True, cancel_futures=True)
             return default_path, body_sample_path
-        except BaseException as e:
-            print(f'{name} failed')
-            traceback.print_exc()
-            print(e)
-            
-            continue
 
     elapsed = time.time() - start_time
     gen_stats['generation_time'] = f'{elapsed:.3f} s'
@@ -184,13 +238,29 @@ def gather_visuals(path, verbose=False):
     vis_path = Path(path) / 'patterns_vis'
     vis_path.mkdir(parents=True, exist_ok=True)
 
-    for p in path.rglob("*.png"):
-        try: 
-            shutil.copy(p, vis_path)
-        except shutil.SameFileError:
-            if verbose:
-                print('File {} already exists'.format(p.name))
-            pass
+    # NOTE: Hard links avoid copying the image data, 
+    # with a fallback to copy where linking is not supported (e.g. across devices)
+    to_visit = [str(path)]
+    while to_visit:
+        with os.scandir(to_visit.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.path != str(vis_path):
+                        to_visit.append(entry.path)
+                    continue
+                if not entry.name.endswith('.png'):
+                    continue
+                target = vis_path / entry.name
+                if target.exists():
+                    if os.path.samefile(entry.path, target):
+                        if verbose:
+                            print('File {} already exists'.format(entry.name))
+                        continue
+                    target.unlink()  # Overwrite the outdated image
+                try:
+                    os.link(entry.path, target)
+                except OSError:
+                    shutil.copy(entry.path, target)
 
 
 if __name__ == '__main__':
@@ -217,7 +287,8 @@ if __name__ == '__main__':
 
     # Generator
     default_path, body_sample_path = generate(
-        system_props['datasets_path'], props, system_props, verbose=False)
+        system_props['datasets_path'], props, system_props, verbose=False, 
+        workers=args.workers)
 
     # Gather the pattern images separately
     gather_visuals(default_path)
@@ -4,12 +4,15 @@
 """
 
 import argparse
+import os
 import random
 import shutil
 import string
 import time
 import traceback
+from copy import copy
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 import assets.garment_programs.stats_utils as stats_utils
@@ -19,7 +22,7 @@ from assets.bodies.body_params import BodyParameters
 from assets.garment_programs.meta_garment import (
     IncorrectElementConfiguration, MetaGarment)
 # Custom
-from pygarment.data_config import Properties
+from pygarment.data_config import Properties, YAMLDumper
 
 
 def get_command_args():
@@ -97,6 +100,16 @@ def _id_generator(size=10, chars=string.ascii_uppercase + string.digits):
     return ''.join(random.choices(chars, k=size))
 
 
+@lru_cache(maxsize=None)
+def _load_body(mes_path: Path):
+    """Load body measurements from file
+        NOTE: Cached since the same body is picked for many samples
+        (cache size is bounded by the number of bodies in the body set).
+        The returned object is shared -- copy it before updating
+    """
+    return BodyParameters(mes_path)
+
+
 def body_sample(bodies: dict, path: Path, straight=True):
 
     rand_name = random.sample(list(bodies.keys()), k=1)
@@ -105,7 +118,9 @@ def body_sample(bodies: dict, path: Path, straight=True):
     mes_file = body_i['mes']
     obj_file = body_i['objs']['straight'] if straight else body_i['objs']['apart']
 
-    body = BodyParameters(path / mes_file)
+    # Copy of the cached body s.t. per-sample updates don't leak
+    body = copy(_load_body(path / mes_file))
+    body.params = copy(body.params)
     body.params['body_sample'] = (path / obj_file).stem
 
     return body
@@ -122,13 +137,15 @@ def _save_sample(piece, body, new_design, folder, verbose=False):
         with_3d=False, with_text=False, view_ids=False)
 
     body.save(folder)
-    with open(Path(folder) / 'design_params.yaml', 'w') as f:
+    # NOTE: Emit to a string first s.t. the file is written in one go
+    (Path(folder) / 'design_params.yaml').write_text(
         yaml.dump(
             {'design': new_design},
-            f,
+            Dumper=YAMLDumper,
             default_flow_style=False,
             sort_keys=False
         )
+    )
     if verbose:
         print(f'Saved {piece.name}')
 
@@ -143,13 +160,29 @@ def gather_visuals(path, verbose=False):
     vis_path = Path(path) / 'patterns_vis'
     vis_path.mkdir(parents=True, exist_ok=True)
 
-    for p in path.rglob("*.png"):
-        try:
-            shutil.copy(p, vis_path)
-        except shutil.SameFileError:
-            if verbose:
-                print('File {} already exists'.format(p.name))
-            pass
+    # NOTE: Hard links avoid copying the image data, 
+    # with a fallback to copy where linking is not supported (e.g. across devices)
+    to_visit = [str(path)]
+    while to_visit:
+        with os.scandir(to_visit.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.path != str(vis_path):
+                        to_visit.append(entry.path)
+                    continue
+                if not entry.name.endswith('.png'):
+                    continue
+                target = vis_path / entry.name
+                if target.exists():
+                    if os.path.samefile(entry.path, target):
+                        if verbose:
+                            print('File {} already exists'.format(entry.name))
+                        continue
+                    target.unlink()  # Overwrite the outdated image
+                try:
+                    os.link(entry.path, target)
+                except OSError:
+                    shutil.copy(entry.path, target)
 
 # Quality filter
 
@@ -236,6 +269,15 @@ def generate(path, properties, sys_paths, verbose=False):
 
     default_body = BodyParameters(
         Path(sys_paths['bodies_default_path']) / (properties['body_default'] + '.yaml'))
+    # Straight/apart legs poses of the default body
+    # NOTE: shallow copies that only differ in the body sample name
+    default_poses = {}
+    for apart in [False, True]:
+        posed_body = copy(default_body)
+        posed_body.params = copy(default_body.params)
+        posed_body.params['body_sample'] = properties['body_default'] + ('_apart' if apart else '')
+        default_poses[apart] = posed_body
+
     sampler = pyg.DesignSampler(properties['design_file'])
     for i in range(properties['size']):
         # log properties every time
@@ -260,15 +302,10 @@ def generate(path, properties, sys_paths, verbose=False):
                 assert_param_combinations(new_design)
 
                 # On default body
+                default_body = default_poses[has_pants(new_design)]
                 piece_default = MetaGarment(name, default_body, new_design)
                 piece_default.assert_total_length()  # Check final length correctnesss
 
-                # Straight/apart legs pose
-                def_obj_name = properties['body_default']
-                if has_pants(new_design):
-                    def_obj_name += '_apart'
-                default_body.params['body_sample'] = def_obj_name
-
                 # On random body shape
                 rand_body = body_sample(
                     body_options,
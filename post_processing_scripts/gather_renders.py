@@ -3,6 +3,7 @@
 import pygarment.data_config as config
 from pathlib import Path
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 from pattern_data_sim import gather_renders
 
@@ -14,12 +15,19 @@ datapaths = [
     Path(system_props['output']) / dataset / 'random_body'
 ]
 
-for datapath in datapaths:
-    # Check packing
+def _unpack(datapath):
+    """Unpack the data archive in place (if any)"""
     tar_path = datapath / 'data.tar.gz'
     if tar_path.exists():
         shutil.unpack_archive(tar_path, datapath)
         # Finally -- clean up
         tar_path.unlink()
 
+
+# Check packing
+# NOTE: zlib decompression releases the GIL, so archives are unpacked concurrently
+with ThreadPoolExecutor(max_workers=min(8, len(datapaths))) as executor:
+    list(executor.map(_unpack, datapaths))
+
+for datapath in datapaths:
     gather_renders(datapath)
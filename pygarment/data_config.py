@@ -35,6 +35,16 @@ def float_representer(dumper, data):
     return dumper.represent_scalar('tag:yaml.org,2002:float', value)
 yaml.add_representer(float, float_representer)
 
+# --- Fast YAML parsing & emitting ---
+# Use libyaml-based classes when available (much faster)
+try:
+    from yaml import CSafeLoader, CDumper
+    YAMLLoader, YAMLDumper = CSafeLoader, CDumper
+except ImportError:  # PyYAML is built without libyaml
+    YAMLLoader, YAMLDumper = yaml.SafeLoader, yaml.Dumper
+# Same float representation for dumps with the selected dumper
+yaml.add_representer(float, float_representer, Dumper=YAMLDumper)
+
 
 # --- Main class ----
 class Properties():
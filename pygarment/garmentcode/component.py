@@ -44,6 +44,8 @@ class Component(BaseComponent):
 
     def translate_by(self, delta_vector):
         """Translate component by a vector"""
+        # Convert once instead of in every sub-panel
+        delta_vector = np.asarray(delta_vector, dtype=float)
         for subs in self._get_subcomponents():
             subs.translate_by(delta_vector)
         return self
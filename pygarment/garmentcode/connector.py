@@ -29,8 +29,11 @@ class StitchingRule:
         self.int1 = int1
         self.int2 = int2
         self.verbose = verbose
-        if not self.isMatching():
-            self.match_interfaces()
+        # NOTE: Evaluate the projections once for both the check and the matching
+        frac1 = int1.projecting_fractions()
+        frac2 = int2.projecting_fractions()
+        if not self._fractions_match(frac1, frac2):
+            self.match_interfaces(frac1, frac2)
 
         if verbose and not close_enough(
                 len1 := int1.projecting_lengths().sum(),
@@ -42,25 +45,32 @@ class StitchingRule:
 
     def isMatching(self, tol=0.05):
         # if both the breakdown and relative partitioning is similar
+        return self._fractions_match(
+            self.int1.projecting_fractions(),
+            self.int2.projecting_fractions(),
+            tol=tol)
 
-        frac1 = self.int1.projecting_fractions()
-        frac2 = self.int2.projecting_fractions()
-
+    def _fractions_match(self, frac1, frac2, tol=0.05):
         return len(self.int1) == len(self.int2) and np.allclose(frac1, frac2, atol=tol)
 
-    def match_interfaces(self):
+    def match_interfaces(self, frac1=None, frac2=None):
         """ Subdivide the interface edges on both sides s.t. they are matching 
             and can be safely connected
             (same number of edges on each side and same relative fractions)
 
             Serializable format does not natively support t-stitches, 
             so the longer edges needs to be broken down into matching segments
+
+            * frac1, frac2 -- (optional) precomputed projecting fractions of
+                the interfaces
         """
 
         # Eval the fractions corresponding to every segment in the interfaces
         # Using projecting edges to match desired gather patterns
-        frac1 = self.int1.projecting_fractions()
-        frac2 = self.int2.projecting_fractions()
+        if frac1 is None:
+            frac1 = self.int1.projecting_fractions()
+        if frac2 is None:
+            frac2 = self.int2.projecting_fractions()
         # projection tolerance should not be larger than the smallest fraction
         min_frac = min(min(frac1), min(frac2))
 
@@ -1,3 +1,4 @@
+import math
 from copy import copy, deepcopy
 from typing import List, Union
 
@@ -18,6 +19,9 @@ class Edge:
     Edges are defined on 2D coordinate system with Start vertex as an origin
         and (End-Start) as Ox axis
     """
+    # NOTE: Panels hold many edges -- slots save the per-instance dict
+    # 'flipped' is set on oriented copies of the edges in the interfaces
+    __slots__ = ('start', 'end', 'label', 'geometric_id', 'flipped')
 
     def __init__(self, start=None, end=None, label='') -> None:
         """ Simple edge initialization.
@@ -46,6 +50,18 @@ class Edge:
         # Filled out at the panel assembly time
         self.geometric_id = 0
 
+    def __deepcopy__(self, memo):
+        """Copy that only duplicates the mutable geometry of the edge
+            (other attributes are immutable and can be shared)
+
+            NOTE: Vertex objects shared by the edges remain shared 
+            in the copies made within the same deepcopy() call
+        """
+        new_edge = copy(self)
+        new_edge.start = deepcopy(self.start, memo)
+        new_edge.end = deepcopy(self.end, memo)
+        return new_edge
+
     def length(self):
         """Return current length of an edge.
             Since vertices may change their locations externally, the length
@@ -55,7 +71,10 @@ class Edge:
 
     def _straight_len(self):
         """Length of the edge ignoring the curvature"""
-        return norm(np.asarray(self.end) - np.asarray(self.start))
+        # NOTE: scalar math on 2D vertices avoids numpy array allocations
+        dx = self.end[0] - self.start[0]
+        dy = self.end[1] - self.start[1]
+        return math.sqrt(dx * dx + dy * dy)
 
     def __eq__(self, __o: object, tol=1e-2) -> bool:
         """Special implementation of comparison: same edges == edges can be
@@ -67,15 +86,14 @@ class Edge:
             NOTE: The edges may not have the same curvature and still be
             considered equal ("connectible")
         """
+        if self is __o:
+            return True
 
         if not isinstance(__o, Edge):
             return False
 
         # Base length is the same
-        if close_enough(self.length(), __o.length(), tol=tol):
-            return False
-
-        return True
+        return close_enough(self.length(), __o.length(), tol=tol)
 
     def __str__(self) -> str:
         return f'Straight:[{self.start[0]:.2f}, {self.start[1]:.2f}]->[{self.end[0]:.2f}, {self.end[1]:.2f}]'
@@ -261,6 +279,7 @@ class Edge:
 
 class CircleEdge(Edge):
     """Curvy edge as circular arc"""
+    __slots__ = ('control_y', )
 
     def __init__(self, start=None, end=None, cy=None, label='') -> None:
         """
@@ -416,8 +435,8 @@ class CircleEdge(Edge):
         # (0, 0) and (1, 0)
         # accordingly
         a = 1
-        b = norm([0.5, self.control_y])
-        c = norm([0.5 - 1, self.control_y])
+        b = math.sqrt(0.5 * 0.5 + self.control_y * self.control_y)
+        c = b  # NOTE: control point is fixed at x=0.5 => isosceles triangle
         p = (a + b + c) / 2  # semiperimeter
 
         rad = a * b * c / np.sqrt(p * (p - a) * (p - b) * (p - c)) / 4
@@ -458,6 +477,7 @@ class CircleEdge(Edge):
 
 class CurveEdge(Edge):
     """Curvy edge as Besier curve / B-spline"""
+    __slots__ = ('control_points', '_length_cache')
 
     def __init__(self, start=None, end=None, control_points=None,
                  relative=True,
@@ -495,11 +515,32 @@ class CurveEdge(Edge):
             self.control_points = [abs_to_rel_2d(self.start, self.end, c).tolist()
                                    for c in self.control_points]
 
+        # Cached length as (geometry key, value) pair
+        self._length_cache = None
+
+    def __deepcopy__(self, memo):
+        new_edge = super().__deepcopy__(memo)
+        new_edge.control_points = deepcopy(self.control_points, memo)
+        return new_edge
+
     def length(self):
-        """Length of Bezier curve edge"""
-        curve = self.as_curve()
+        """Length of Bezier curve edge
+
+            NOTE: Arc length evaluation requires numerical integration, so
+            the value is cached. Since vertices and control points may be
+            updated externally, the cache is validated against the current
+            edge geometry on every call
+        """
+        key = self._geometry_key()
+        if self._length_cache is None or self._length_cache[0] != key:
+            self._length_cache = (key, self.as_curve().length())
+
+        return self._length_cache[1]
 
-        return curve.length()
+    def _geometry_key(self):
+        """Hashable snapshot of the current edge geometry"""
+        return (self.start[0], self.start[1], self.end[0], self.end[1],
+                *(c for cp in self.control_points for c in cp))
 
     def __str__(self) -> str:
 
@@ -681,7 +722,7 @@ class EdgeSequence:
 
     def __contains__(self, item):
         # check presence by comparing references
-        return any([item is e for e in self.edges])
+        return any(item is e for e in self.edges)
 
     def __str__(self) -> str:
         return 'EdgeSeq: ' + str(self.edges)
@@ -798,8 +839,7 @@ class EdgeSequence:
         if isinstance(item, Edge):
             self.edges.insert(i, item)
         elif isinstance(item, list) or isinstance(item, EdgeSequence):
-            for j in range(len(item)):
-                self.edges.insert(i + j, item[j])
+            self.edges[i:i] = [item[j] for j in range(len(item))]
         else:
             raise NotImplementedError(
                 f'{self.__class__.__name__}::ERROR::incerting object of {type(item)} not suported (yet)')
@@ -864,17 +904,16 @@ class EdgeSequence:
         Parameters: 
             angle -- desired rotation angle in radians (!)
         """
-        curr_start = copy(self[0].start)
-
-        # set the start point to zero
-        self.snap_to([0, 0])
         rot = R2D(angle)
 
-        for v in self.verts():
-            v[:] = np.matmul(rot, v)
-
-        # recover the original location
-        self.snap_to(curr_start)
+        # NOTE: Transform all the vertex coordinates at once 
+        # (shift the start point to zero -> rotate -> shift back),
+        # then update the (shared) vertex objects in place
+        verts = self.verts()
+        curr_start = np.asarray(verts[0])
+        new_coords = (np.asarray(verts) - curr_start) @ rot.T + curr_start
+        for v, new_v in zip(verts, new_coords):
+            v[:] = new_v
 
         return self
 
@@ -909,11 +948,9 @@ class EdgeSequence:
         nverts_coords = np.array(verts_coords)
 
         # adjust their position based on projection to the target line
-        verts_projection = np.empty(nverts_coords.shape)
         fixed = nverts_coords[0]
-        for i in range(nverts_coords.shape[0]):
-            verts_projection[i] = (
-                nverts_coords[i] - fixed).dot(target_line) * target_line
+        verts_projection = np.outer(
+            (nverts_coords - fixed) @ target_line, target_line)
 
         new_verts = verts_coords - (1 - factor) * verts_projection
 
@@ -936,8 +973,10 @@ class EdgeSequence:
         ])
 
         # translate -> reflect -> translate back
-        for v in self.verts():
-            v[:] = np.matmul(Ref, np.asarray(v) - v0) + v0
+        verts = self.verts()
+        new_coords = (np.asarray(verts) - v0) @ Ref.T + v0
+        for v, new_v in zip(verts, new_coords):
+            v[:] = new_v
 
         # Reflect edge features (curvatures, etc.)
         for e in self.edges:
@@ -235,7 +235,10 @@ class EdgeSeqFactory:
         edges = []
         for seg in path._segments:
             # skip segments of length zero
-            if close_enough(seg.length(), tol=dist_tol):
+            # NOTE: The chord bounds the segment length from below, so
+            # the (numerical) length is only evaluated for short segments
+            if (abs(seg.end - seg.start) < dist_tol
+                    and close_enough(seg.length(), tol=dist_tol)):
                 if verbose:
                     print('Skipped: ', seg)
                 continue
@@ -258,15 +261,13 @@ class EdgeSeqFactory:
         """Generate sequence of straight edges from given vertices. If loop==True,
          the method also closes the edge sequence as a loop
         """
-        seq = EdgeSequence(Edge(verts[0], verts[1]))
-        for i in range(2, len(verts)):
-            seq.append(Edge(seq[-1].end, verts[i]))
-
+        # NOTE: Neighbouring edges share the vertex objects,
+        # so the sequence is chained by construction
+        edges = [Edge(v_start, v_end) for v_start, v_end in zip(verts[:-1], verts[1:])]
         if loop:
-            seq.append(Edge(seq[-1].end, seq[0].start))
+            edges.append(Edge(verts[-1], verts[0]))
 
-        seq.isChained()  # print warning if smth is wrong
-        return seq
+        return EdgeSequence(edges)
 
     @staticmethod
     def from_fractions(start, end, frac=None):
@@ -299,13 +300,14 @@ class EdgeSeqFactory:
 
             start_cut and end_cut specify the fraction of the edge to to add extra vertices at
         """
-        nstart, nend = np.array(start), np.array(end)
+        # NOTE: scalar math on the side direction avoids array round-trips
+        dx, dy = end[0] - start[0], end[1] - start[1]
         verts = [start]
 
         if start_cut > 0:
-            verts.append((start + start_cut * (nend-nstart)).tolist())
+            verts.append([start[0] + start_cut * dx, start[1] + start_cut * dy])
         if end_cut > 0:
-            verts.append((end - end_cut * (nend-nstart)).tolist())
+            verts.append([end[0] - end_cut * dx, end[1] - end_cut * dy])
         verts.append(end)
 
         edges = EdgeSeqFactory.from_verts(*verts)
@@ -351,12 +353,14 @@ class EdgeSeqFactory:
                 shape projection
         """
         paths, _ = svgpath.svg2paths(svg_filepath)
+        bbox = bbox_paths(paths)
 
         # Scaling
         if target_height is not None:
-            bbox = bbox_paths(paths)
             scale = target_height / (bbox[-1] - bbox[-2])
             paths = [p.scaled(scale) for p in paths]
+            # NOTE: Scaling is w.r.t. the origin
+            bbox = [b * scale for b in bbox]
 
         # Get the half-shapes
         left, right = split_half_svg_paths(paths)
@@ -367,7 +371,6 @@ class EdgeSeqFactory:
 
         # In SVG OY is looking downward, we are using OY looking upward
         # Flip the shape to align
-        bbox = bbox_paths(paths)
         center_y = (bbox[2] + bbox[3]) / 2
         left_seqs = [p.reflect([bbox[0], center_y],
                                [bbox[1], center_y]) for p in left_seqs]
@@ -479,22 +482,23 @@ def split_half_svg_paths(paths):
     right, left = [], []
     for p in paths:
         # Intersect points
-        intersect_t = p.intersect(inter_segment)
+        intersect_locs = _vertical_intersections(p, center_x, inter_segment)
 
-        if len(intersect_t) != 2:
+        if len(intersect_locs) != 2:
             raise ValueError(
                 f'SplitSVGHole::ERROR::Each Provided Svg path should cross vertical like exactly 2 times')
 
         # Split
-        from_T, to_T = intersect_t[0][0][0], intersect_t[1][0][0]
-        if to_T < from_T:
-            from_T, to_T = to_T, from_T
+        # NOTE: Cropping by (segment, t) locations directly re-uses the 
+        # path segments and avoids evaluating the path length parametrization
+        from_loc, to_loc = sorted(intersect_locs)
+        segments = p._segments
 
-        side_1 = p.cropped(from_T, to_T)
+        side_1 = svgpath.Path(*_crop_segments(segments, from_loc, to_loc))
         # This order should preserve continuity
         side_2 = svgpath.Path(
-            *p.cropped(to_T, 1)._segments,
-            *p.cropped(0, from_T)._segments)
+            *_crop_segments(segments, to_loc, (len(segments) - 1, 1)),
+            *_crop_segments(segments, (0, 0), from_loc))
 
         # Collect correctly
         if side_1.bbox()[2] > center_x:
@@ -504,3 +508,66 @@ def split_half_svg_paths(paths):
         left.append(side_1)
 
     return left, right
+
+
+def _vertical_intersections(path, x, inter_segment, tol=1e-9):
+    """Locations of the intersections of the path with the vertical line at x
+        as (segment index, segment parameter t) pairs
+
+        Lines and Bezier curves are intersected analytically by solving 
+        for the roots of their x-coordinate polynomial;
+        other segments (arcs) fall back to generic svgpathtools intersection
+        with the inter_segment
+    """
+    intersect_locs, points = [], []
+    for seg_id, seg in enumerate(path):
+        if isinstance(seg, svgpath.Line):
+            dx = seg.end.real - seg.start.real
+            seg_ts = [(x - seg.start.real) / dx] if dx != 0 else []
+        elif isinstance(seg, (svgpath.QuadraticBezier, svgpath.CubicBezier)):
+            # The curve lies within the convex hull of its control points
+            cp_x = [cp.real for cp in seg.bpoints()]
+            if x < min(cp_x) or x > max(cp_x):
+                continue
+            x_poly = np.real(seg.poly().coeffs)
+            x_poly[-1] -= x
+            seg_ts = [r.real for r in np.roots(x_poly) if abs(r.imag) < tol]
+        else:
+            seg_ts = [t for t, _ in seg.intersect(inter_segment)]
+
+        for t in seg_ts:
+            if -tol <= t <= 1 + tol:
+                t = min(max(t, 0.), 1.)
+                # NOTE: intersections at the joints of segments
+                # (or at the loop origin) are found twice 
+                point = seg.point(t)
+                if all(abs(point - other) >= tol for other in points):
+                    points.append(point)
+                    intersect_locs.append((seg_id, t))
+
+    return intersect_locs
+
+
+def _crop_segments(segments, start_loc, end_loc, tol=1e-9):
+    """Segments of the path between two (segment index, t) locations
+        (start_loc should precede end_loc)
+
+        Only the segments at the ends of the range are cropped,
+        the rest are re-used as is
+    """
+    (i0, t0), (i1, t1) = start_loc, end_loc
+    # Locations at the joints of the segments
+    if t0 > 1 - tol and i0 < len(segments) - 1:
+        i0, t0 = i0 + 1, 0
+    if t1 < tol and i1 > 0:
+        i1, t1 = i1 - 1, 1
+
+    if (i0, t0) >= (i1, t1):
+        return []
+    if i0 == i1:
+        return [segments[i0].cropped(t0, t1)]
+
+    cropped = [segments[i0].cropped(t0, 1)] if t0 > 0 else [segments[i0]]
+    cropped += segments[i0 + 1:i1]
+    cropped.append(segments[i1].cropped(0, t1) if t1 < 1 else segments[i1])
+    return cropped
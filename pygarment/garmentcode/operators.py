@@ -1,5 +1,6 @@
 """Shortcuts for common operations on panels and components"""
 from copy import copy, deepcopy
+import math
 
 import numpy as np
 import svgpathtools as svgpath
@@ -60,12 +61,13 @@ def cut_corner(target_shape: EdgeSequence, target_interface: Interface,
         # Orginal edges have beed reversed in normalization or smth
         corner_shape.edges.reverse()  # UPD the order
 
-    if corner_shape[0].start[1] > corner_shape[-1].end[1]:
-        # now corner shape is oriented the same way as vertices
-        corner_shape.reverse()
-        corner_shape.snap_to([0, 0])
-
     shortcut = corner_shape.shortcut()
+    # NOTE: the shape is not reversed here, only its orientation is tracked
+    # s.t. it's reversed at most once when aligning with the corner
+    flipped = corner_shape[0].start[1] > corner_shape[-1].end[1]
+    if flipped:
+        # now shortcut is oriented the same way as vertices
+        shortcut = shortcut[::-1]
 
     # Curves  (can be defined outside)
     curve1 = target_edges[0].as_curve()
@@ -80,31 +82,41 @@ def cut_corner(target_shape: EdgeSequence, target_interface: Interface,
         # NOW curve1 is lower then curve2
 
     # ----- FIND OPTIMAL PLACE -----
-    start = [0.5, 0.5]
-    out = minimize(
-        _fit_location_corner, start,
-        args=(shortcut[1] - shortcut[0], curve1, curve2),
-        bounds=[(0, 1), (0, 1)])
-
-    if verbose and not out.success:
-        print(f'Cut_corner::ERROR::finding the projection (translation) is unsuccessful. Likely an error in edges choice')
-        print(out)
+    # Straight corner edges have a closed-form solution
+    loc = _locate_corner_lines(shortcut[1] - shortcut[0], curve1, curve2)
+    if loc is None:
+        start = [0.5, 0.5]
+        out = minimize(
+            _fit_location_corner, start,
+            args=(shortcut[1] - shortcut[0], curve1, curve2),
+            bounds=[(0, 1), (0, 1)])
+
+        if verbose and not out.success:
+            print(f'Cut_corner::ERROR::finding the projection (translation) is unsuccessful. Likely an error in edges choice')
+            print(out)
 
-    if verbose and not close_enough(out.fun):
-        print(
-            f'Cut_corner::WARNING::projection on {target_interface} finished with fun={out.fun}')
-        print(out)
+        if verbose and not close_enough(out.fun):
+            print(
+                f'Cut_corner::WARNING::projection on {target_interface} finished with fun={out.fun}')
+            print(out)
 
-    loc = out.x
+        loc = out.x
     point1 = c_to_list(curve1.point(loc[0]))
     # re-align corner_shape with found shifts
-    corner_shape.snap_to(point1)
+    if flipped:
+        shape_start = corner_shape[-1].end
+        corner_shape.translate_by(
+            [point1[0] - shape_start[0], point1[1] - shape_start[1]])
+    else:
+        corner_shape.snap_to(point1)
 
     # ----- UPD panel ----
     # Complete to the full corner -- connect with the initial vertices
-    if swaped:
-        # The edges are aligned as v2 -> vc -> v1
+    if swaped != flipped:
+        # The edges should be aligned as v2 -> vc -> v1 if swaped,
+        # and v1 -> vc -> v2 otherwise
         corner_shape.reverse()
+    if swaped:
         loc[0], loc[1] = loc[1], loc[0]
 
     # Insert a new shape
@@ -118,8 +130,14 @@ def cut_corner(target_shape: EdgeSequence, target_interface: Interface,
     corner_shape.append(cut_edge2)
 
     # Substitute edges in the panel definition
-    panel.edges.pop(target_edges[0])
-    panel.edges.substitute(target_edges[1], corner_shape)
+    # NOTE: single pass instead of pop() + substitute() that re-index the list
+    new_edges = []
+    for e in panel.edges.edges:
+        if e is target_edges[1]:
+            new_edges += corner_shape.edges
+        elif e is not target_edges[0]:
+            new_edges.append(e)
+    panel.edges.edges[:] = new_edges
 
     # Update interface definitions
     # keep the same edge references,
@@ -128,12 +146,17 @@ def cut_corner(target_shape: EdgeSequence, target_interface: Interface,
     # In case it matches one of the interfaces (we don't want target edges to be overriden)
     iter = panel.interfaces if isinstance(
         panel.interfaces, list) else panel.interfaces.values()
+    # Substitute old edges with what's left from them after cutting
+    # NOTE: lookup by reference s.t. every interface is scanned only once
+    leftovers = {
+        id(target_edges[0]): corner_shape[0],
+        id(target_edges[1]): corner_shape[-1]
+    }
     for intr in iter:
-        # Substitute old edges with what's left from them after cutting
-        if target_edges[0] in intr.edges:
-            intr.edges.substitute(target_edges[0], corner_shape[0])
-        if target_edges[1] in intr.edges:
-            intr.edges.substitute(target_edges[1], corner_shape[-1])
+        intr_edges = intr.edges.edges
+        for i, e in enumerate(intr_edges):
+            if id(e) in leftovers:
+                intr_edges[i] = leftovers[id(e)]
 
     # Add new interface corresponding to the introduced cut
     new_int = Interface(panel, corner_shape[1:-1])
@@ -260,7 +283,8 @@ def cut_into_edge_single(target_shape, base_edge: Edge, offset=0, right=True,
     start = [0.1, 0.1]
     out = minimize(
         _fit_location_edge, start,
-        args=(rel_offset, target_shape_w, curve),
+        args=(rel_offset, target_shape_w, curve,
+              c_to_list(curve.point(rel_offset))),
         bounds=[(0, 1)])
     shift = out.x
 
@@ -332,41 +356,74 @@ def cut_into_edge_single(target_shape, base_edge: Edge, offset=0, right=True,
     return new_edges, new_edges[start_id:end_id], base_edge_leftovers
 
 
+def _locate_corner_lines(diff_target, line1, line2):
+    """Closed-form version of the corner location fit for straight edges:
+        find the parameters on two lines s.t. the vector between
+        the corresponding points is the same as shortcut
+
+        Returns None if the edges are not straight lines or
+        the solution does not lie on both of the edges
+    """
+    if not (isinstance(line1, svgpath.Line) and isinstance(line2, svgpath.Line)):
+        return None
+
+    # point2 - point1 = diff_target =>
+    #   l[1] * dir2 - l[0] * dir1 = diff_target - (start2 - start1)
+    dir1, dir2 = line1.end - line1.start, line2.end - line2.start
+    rhs = complex(diff_target[0], diff_target[1]) - (line2.start - line1.start)
+
+    det = dir1.imag * dir2.real - dir1.real * dir2.imag
+    if close_enough(det, tol=1e-8):   # Parallel edges
+        return None
+    l1 = (rhs.real * dir2.imag - rhs.imag * dir2.real) / det
+    l2 = (dir1.imag * rhs.real - dir1.real * rhs.imag) / det
+
+    if not (0 <= l1 <= 1 and 0 <= l2 <= 1):
+        # The optimization would clamp the solution to the edges
+        return None
+
+    return np.array([l1, l2])
+
+
 def _fit_location_corner(l, diff_target, curve1, curve2,
                          verbose: bool = False):
     """Find the points on two curves s.t. vector between them is the same as
     shortcut"""
 
     # Current points on curves
-    point1 = c_to_np(curve1.point(l[0]))
-    point2 = c_to_np(curve2.point(l[1]))
-    diff_curr = point2 - point1
+    # NOTE: Evaluated directly in complex numbers to avoid 
+    # creating small arrays on every evaluation
+    diff_curr = curve2.point(l[1]) - curve1.point(l[0])
 
     if verbose:
-        print('Location Progression: ', (diff_curr[0] - diff_target[0])**2,
-              (diff_curr[1] - diff_target[1])**2)
+        print('Location Progression: ', (diff_curr.real - diff_target[0])**2,
+              (diff_curr.imag - diff_target[1])**2)
 
-    return ((diff_curr[0] - diff_target[0])**2
-            + (diff_curr[1] - diff_target[1])**2)
+    return ((diff_curr.real - diff_target[0])**2
+            + (diff_curr.imag - diff_target[1])**2)
 
 
-def _fit_location_edge(shift, location, width_target, curve,
+def _fit_location_edge(shift, location, width_target, curve, pointc,
                        verbose: bool = False):
     """Find the points on two curves s.t. vector between them is the same as
-    shortcut"""
+    shortcut
+
+    NOTE: pointc is the (constant) point on the curve at the location,
+    evaluated once by the caller
+    """
 
     # Current points on curves
-    pointc = c_to_np(curve.point(location))   # TODO this is constant
-    point1 = c_to_np(curve.point(location + shift[0]))
-    point2 = c_to_np(curve.point(location - shift[1]))
+    point1 = c_to_list(curve.point(location + shift[0]))
+    point2 = c_to_list(curve.point(location - shift[1]))
 
+    width_fit = (_dist(point1, point2) - width_target)**2
     if verbose:
-        print('Location Progression: ', (_dist(point1, point2) - width_target)**2)
+        print('Location Progression: ', width_fit)
 
     # regularize points to be at the same distance from center
     reg_symmetry = (_dist(point1, pointc) - _dist(point2, pointc))**2
 
-    return (_dist(point1, point2) - width_target)**2 + reg_symmetry
+    return width_fit + reg_symmetry
 
 
 # ANCHOR ----- Panel operations ------
@@ -374,14 +431,18 @@ def distribute_Y(component, n_copies, odd_copy_shift=0, name_tag='panel'):
     """Distribute copies of component over the circle around Oy"""
     copies = [component]
     component.name = f'{name_tag}_0'   # Unique
-    delta_rotation = R.from_euler('XYZ', [0, 360 / n_copies, 0], degrees=True)
+
+    # NOTE: All rotations are evaluated at once directly from their angles,
+    # instead of accumulating the same delta rotation copy by copy
+    angles = np.arange(1, n_copies) * (360 / n_copies)
+    rotations = R.from_euler('Y', angles[:, None], degrees=True)
+    translations = rotations.apply(component.translation)
 
     for i in range(n_copies - 1):
-        new_component = deepcopy(copies[-1])
+        new_component = deepcopy(component)
         new_component.name = f'{name_tag}_{i + 1}'   # Unique
-        new_component.rotate_by(delta_rotation)
-        new_component.translate_to(
-            delta_rotation.apply(new_component.translation))
+        new_component.rotate_by(rotations[i])
+        new_component.translate_to(translations[i])
 
         copies.append(new_component)
 
@@ -607,19 +668,7 @@ def curve_match_tangents(curve, target_tan0, target_tan1, target_len=None,
 # ---- Utils ----
 
 def _dist(v1, v2):
-    return norm(v2-v1)
-
-
-def _fit_scale(s, shortcut, v1, v2, vc, d_v1, d_v2):
-    """Evaluate how good a shortcut fits the corner if the vertices are shifted 
-        a little along the line"""
-    # Shortcut can be used as 2D vector, not a set of 2D points, e.g.
-    shifted = deepcopy(shortcut)
-    # this only changes the end vertex though
-    shifted[0] += (shortcut[0] - shortcut[1]) * s[0]
-    # this only changes the end vertex though
-    shifted[1] += (shortcut[1] - shortcut[0]) * s[1]
-
-    return ((d_v1 - _dist(shifted[0], v1) - _dist(shifted[0], vc))**2
-            + (d_v2 - _dist(shifted[1], v2) - _dist(shifted[1], vc))**2
-            )
+    # NOTE: scalar math is much faster than norm() on 2D vectors
+    dx, dy = v2[0] - v1[0], v2[1] - v1[1]
+    return math.sqrt(dx * dx + dy * dy)
+
@@ -146,7 +146,7 @@ class Panel(BaseComponent):
 
     def translate_by(self, delta_vector):
         """Translate panel by a vector"""
-        self.translation = self.translation + np.array(delta_vector)
+        self.translation = self.translation + np.asarray(delta_vector)
         # NOTE: One may also want to have autonorm only on the assembly?
         self.autonorm()
         return self
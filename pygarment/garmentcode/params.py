@@ -6,6 +6,7 @@ from copy import deepcopy
 import random 
 
 from pygarment.garmentcode.utils import nested_get, nested_set, close_enough
+from pygarment.data_config import YAMLLoader, YAMLDumper
 
 
 class BodyParametrizationBase:
@@ -35,7 +36,7 @@ class BodyParametrizationBase:
     def load(self, param_file):
         """Load new values from file"""
         with open(param_file, 'r') as f:
-            dict = yaml.safe_load(f)['body']
+            dict = yaml.load(f, Loader=YAMLLoader)['body']
         self.params.update(dict)
         self.eval_dependencies()  # Parameters have been updated
 
@@ -59,6 +60,7 @@ class BodyParametrizationBase:
             yaml.dump(
                 {'body': self.params}, 
                 f,
+                Dumper=YAMLDumper,
                 default_flow_style=False
             )
 
@@ -75,7 +77,7 @@ class DesignSampler:
     def load(self, param_file):
         """Load new values from file"""
         with open(param_file, 'r') as f:
-            dict = yaml.safe_load(f)['design']
+            dict = yaml.load(f, Loader=YAMLLoader)['design']
         self.params.update(dict)
 
     def default(self):
@@ -69,8 +69,8 @@ def bbox_paths(paths):
     """Bounding box of a list of paths/Edge Sequences"""
 
     bboxes = np.array([p.bbox() for p in paths])
-    return (min(bboxes[:, 0]), max(bboxes[:, 1]),
-            min(bboxes[:, 2]), max(bboxes[:, 3]))
+    return (bboxes[:, 0].min(), bboxes[:, 1].max(),
+            bboxes[:, 2].min(), bboxes[:, 3].max())
 
 
 def lin_interpolation(val1, val2, factor):
@@ -47,14 +47,14 @@ def rel_to_abs_2d(start, end, rel_point):
         to the edge [start, end] into edge vertices (global) coordinate frame
     """
 
-    start, end = np.array(start), np.array(end)  # in case inputs are lists/tuples
-    edge = end - start
-    edge_perp = np.array([-edge[1], edge[0]])
+    # NOTE: Evaluated on scalars -- it's called for every curve evaluation,
+    # and small array ops are much slower on 2D points
+    edge_x, edge_y = end[0] - start[0], end[1] - start[1]
 
-    abs_start = start + rel_point[0] * edge
-    abs_point = abs_start + rel_point[1] * edge_perp
+    abs_x = start[0] + rel_point[0] * edge_x + rel_point[1] * -edge_y
+    abs_y = start[1] + rel_point[0] * edge_y + rel_point[1] * edge_x
 
-    return abs_point
+    return np.array([abs_x, abs_y])
 
 def abs_to_rel_2d(start, end, abs_point, as_vector=False):
     """
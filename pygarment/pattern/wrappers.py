@@ -18,8 +18,6 @@ import cairosvg
 import svgpathtools as svgpath
 import svgwrite as sw
 
-import matplotlib.pyplot as plt
-
 # my
 from pygarment import data_config
 from . import core
@@ -314,6 +312,8 @@ class VisPattern(core.ParametrizedPattern):
         """Save the patterns with 3D positioning using matplotlib visualization"""
 
         # NOTE: this routine is mostly needed for debugging
+        # => pyplot is only imported when needed (heavy import)
+        import matplotlib.pyplot as plt
 
         fig = plt.figure(figsize=(30 / 2.54, 30 / 2.54))
         ax = fig.add_subplot(projection='3d')